@@ -1,48 +1,79 @@
 import requests
 import json
-from typing import Optional, Dict, Any
+import re
+import time
+import logging
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Tuple
+from requests.adapters import HTTPAdapter
 import config # Use direct import as it's top-level
 
-def execute_nerdgraph_query(query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """
-    Executes a NerdGraph query and returns the JSON response dictionary.
+try:
+    import orjson # Optional: much faster encoding of request bodies and large NerdGraph/NRQL results
+except ImportError:
+    orjson = None
 
-    Args:
-        query: The GraphQL query string.
-        variables: Optional dictionary of variables for parameterized queries.
+# Log instead of print: with the STDIO transport, stdout carries the JSON-RPC stream.
+logger = logging.getLogger(__name__)
 
-    Returns:
-        A dictionary representing the JSON response from NerdGraph, including potential 'errors'.
-    """
-    if not config.API_KEY: # Check API key again just in case
-        return {"errors": [{"message": "Configuration error: API_KEY is not set."}]}
+# Shared session so repeated tool calls reuse keep-alive connections to NerdGraph
+# instead of paying a new TCP + TLS handshake on every request.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
 
-    headers = {
-        "Content-Type": "application/json",
-        "API-Key": config.API_KEY,
-        "Accept": "application/json", # Ensure we get JSON back
-    }
-    payload: Dict[str, Any] = {"query": query}
-    if variables:
-        payload["variables"] = variables
+# Results of opt-in cached queries: digest of the request payload -> (expires_at, result)
+_QUERY_CACHE_MAX_ENTRIES = 256
+_query_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+# Sync tools may run on worker threads, so every cache read/write holds this lock
+_query_cache_lock = threading.Lock()
+
+# Read queries currently being sent: digest of the request payload -> Future shared by duplicates
+_inflight_requests: Dict[bytes, "Future[Dict[str, Any]]"] = {}
+_inflight_lock = threading.Lock()
+
+# Leading GraphQL "ignored tokens": whitespace, commas and '#' line comments
+_GRAPHQL_IGNORED_PREFIX = re.compile(r"(?:[\s,\ufeff]|#[^\n\r]*)*")
+_GRAPHQL_QUERY_KEYWORD = re.compile(r"query(?![_0-9A-Za-z])")
+
+def _is_read_query(query: str) -> bool:
+    """True only for documents that open with a query operation ('{' shorthand or 'query')."""
+    rest = query[_GRAPHQL_IGNORED_PREFIX.match(query).end():]
+    return rest.startswith("{") or _GRAPHQL_QUERY_KEYWORD.match(rest) is not None
 
-    print(f"Executing NerdGraph Query:\nQuery: {query}\nVariables: {variables}")
+def _query_cache_key(payload: Dict[str, Any]) -> bytes:
+    serialized = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(serialized, digest_size=16).digest()
 
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Encodes the request body, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass # Values orjson can't encode; fall back to the stdlib encoder
+    return json.dumps(payload).encode()
+
+def _send_nerdgraph_request(payload: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+    """Posts the payload to NerdGraph and returns the decoded response, or an 'errors' dict."""
     try:
         # Use constants from config module
-        response = requests.post(config.NERDGRAPH_URL, headers=headers, json=payload, timeout=45)
+        response = _session.post(config.NERDGRAPH_URL, headers=headers, data=_encode_payload(payload), timeout=45)
         response.raise_for_status()
+        # Decode with the stdlib parser: orjson turns integers wider than 64 bits into floats
         return response.json()
     except requests.exceptions.Timeout:
         error_message = "NerdGraph API request timed out."
-        print(error_message)
+        logger.error(error_message)
         return {"errors": [{"message": error_message}]}
     except requests.exceptions.RequestException as e:
         error_message = f"NerdGraph API request failed: {e}"
         # Try to get more detail from response if available
         if e.response is not None:
             error_message += f" Status Code: {e.response.status_code}. Response: {e.response.text[:500]}" # Limit response length
-        print(error_message)
+        logger.error(error_message)
         return {"errors": [{"message": error_message}]}
     except json.JSONDecodeError as e_json:
         error_message = f"Failed to decode NerdGraph API JSON response: {e_json}"
@@ -50,24 +81,112 @@ def execute_nerdgraph_query(query: str, variables: Optional[Dict[str, Any]] = No
         raw_response_text = ""
         if 'response' in locals() and hasattr(response, 'text'):
             raw_response_text = response.text[:500] # Limit response length
-        print(error_message)
+        logger.error(error_message)
         return {"errors": [{"message": error_message, "raw_response": raw_response_text}]}
 
+def execute_nerdgraph_query(query: str, variables: Optional[Dict[str, Any]] = None, cache_ttl: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Executes a NerdGraph query and returns the JSON response dictionary.
+
+    Identical read queries issued concurrently (e.g. from tools running on worker
+    threads) share a single HTTP request. Only documents starting with a query
+    operation are coalesced; everything else (mutations included) is sent individually.
+
+    Args:
+        query: The GraphQL query string.
+        variables: Optional dictionary of variables for parameterized queries.
+        cache_ttl: If set, successful results are memoized for this many seconds and
+                   identical queries within that window skip the HTTP request.
+                   Only use for read-only queries whose data changes rarely.
+
+    Returns:
+        A dictionary representing the JSON response from NerdGraph, including potential 'errors'.
+        The dictionary may be shared with other callers, so treat it as read-only.
+    """
+    if not config.API_KEY: # Check API key again just in case
+        return {"errors": [{"message": "Configuration error: API_KEY is not set."}]}
+
+    headers = {
+        "Content-Type": "application/json",
+        "API-Key": config.API_KEY,
+        "Accept": "application/json", # Ensure we get JSON back
+    }
+    payload: Dict[str, Any] = {"query": query}
+    if variables:
+        payload["variables"] = variables
+
+    # Only coalesce/cache documents that are positively reads; mutations, subscriptions,
+    # fragment-first or unrecognized documents are always sent individually.
+    if not _is_read_query(query):
+        logger.debug("Executing NerdGraph Query:\nQuery: %s\nVariables: %s", query, variables)
+        return _send_nerdgraph_request(payload, headers)
+
+    request_key = _query_cache_key(payload)
+    if cache_ttl:
+        with _query_cache_lock:
+            cached = _query_cache.get(request_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+    # Single-flight: the first caller sends the request, concurrent duplicates wait on its future
+    with _inflight_lock:
+        future = _inflight_requests.get(request_key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight_requests[request_key] = future
+    if not is_leader:
+        return future.result()
+
+    try:
+        logger.debug("Executing NerdGraph Query:\nQuery: %s\nVariables: %s", query, variables)
+        result = _send_nerdgraph_request(payload, headers)
+        if cache_ttl and not result.get("errors"):
+            with _query_cache_lock:
+                # Re-insert a refreshed key at the end instead of evicting another entry for it
+                _query_cache.pop(request_key, None)
+                if len(_query_cache) >= _QUERY_CACHE_MAX_ENTRIES:
+                    _query_cache.pop(next(iter(_query_cache))) # Drop the first-inserted entry
+                _query_cache[request_key] = (time.monotonic() + cache_ttl, result)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_requests.pop(request_key, None)
+
+def dumps_indented(obj: Any) -> str:
+    """
+    Serializes obj as indented JSON, using orjson when it is installed.
+
+    The result is equivalent JSON, but not byte-identical across encoders: orjson
+    writes non-ASCII characters as raw UTF-8 and formats floats like 1e29, where
+    json.dumps writes \\u00e9-style escapes and 1e+29.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass # e.g. integers beyond 64 bits; let the stdlib encoder handle (or report) it
+    return json.dumps(obj, indent=2)
+
 def format_json_response(result: Dict[str, Any]) -> str:
     """Formats the result dictionary as a JSON string for MCP return."""
     # Handle potential GraphQL errors reported within the JSON payload
     if "errors" in result and result["errors"]: # Check if errors list is not empty
-        print(f"NerdGraph query returned errors: {json.dumps(result['errors'], indent=2)}")
+        logger.warning("NerdGraph query returned errors: %s", json.dumps(result['errors'], indent=2))
         # Pass errors through in the JSON string
     elif "data" not in result and "errors" not in result:
          # If no 'data' and no 'errors', it might be an unexpected response format
-         print(f"Warning: NerdGraph response missing 'data' and 'errors' fields: {json.dumps(result, indent=2)}")
+         logger.warning("NerdGraph response missing 'data' and 'errors' fields: %s", json.dumps(result, indent=2))
 
     try:
         # Return the full result (including data and/or errors)
-        return json.dumps(result, indent=2)
+        return dumps_indented(result)
     except TypeError as e:
         error_message = f"Failed to serialize NerdGraph response to JSON: {e}"
-        print(error_message)
+        logger.error(error_message)
         # Return an error structure if serialization fails
         return json.dumps({"errors": [{"message": error_message, "original_result_type": str(type(result))}]}) 
\ No newline at end of file
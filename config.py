@@ -1,4 +1,7 @@
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Load API Key (Required)
 API_KEY = os.getenv("NEW_RELIC_API_KEY")
@@ -11,12 +14,12 @@ ACCOUNT_ID: int | None = None
 if ACCOUNT_ID_STR:
     try:
         ACCOUNT_ID = int(ACCOUNT_ID_STR)
-        print(f"Using New Relic Account ID: {ACCOUNT_ID}")
+        logger.debug("Using New Relic Account ID: %s", ACCOUNT_ID)
     except ValueError:
         # Don't raise immediately, let features that require it handle the None case
-        print(f"Warning: NEW_RELIC_ACCOUNT_ID ('{ACCOUNT_ID_STR}') is not a valid integer. Features requiring an Account ID may fail.")
+        logger.warning("NEW_RELIC_ACCOUNT_ID ('%s') is not a valid integer. Features requiring an Account ID may fail.", ACCOUNT_ID_STR)
 else:
-    print("Warning: NEW_RELIC_ACCOUNT_ID environment variable not set. Some features require it.")
+    logger.warning("NEW_RELIC_ACCOUNT_ID environment variable not set. Some features require it.")
 
 
 # NerdGraph API Endpoint
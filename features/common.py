@@ -94,13 +94,14 @@ def register(mcp: FastMCP):
           }}
         }}
         """
-        result = client.execute_nerdgraph_query(query)
+        # Account name/ID rarely change, so serve repeat reads from the client cache
+        result = client.execute_nerdgraph_query(query, cache_ttl=300)
         # Filter data before returning to just the account info
         account_data = result.get("data", {}).get("actor", {}).get("account", None)
         if account_data:
             # Keep the 'data' wrapper for consistency maybe? Or return only account?
             # Let's return just the account dict within 'data' for cleaner resource output
-            return json.dumps({"data": account_data}, indent=2)
+            return client.dumps_indented({"data": account_data})
         else:
              # Pass through errors if any, or provide a generic error
              if "errors" in result and result["errors"]:
@@ -1,10 +1,17 @@
 # server.py
 import os
+import logging
 from fastmcp import FastMCP
 
 # Import feature modules
 from features import common, entities, apm, synthetics, alerts
 
+# Log instead of print: with the STDIO transport, anything written to stdout
+# is read by the MCP client and corrupts the JSON-RPC stream.
+logger = logging.getLogger(__name__)
+
+FEATURE_MODULES = (common, entities, apm, synthetics, alerts)
+
 # --- FastMCP Server Initialization ---
 # Dependencies are defined here, but execution relies on fastmcp CLI handling them
 # unless run directly with `python server.py` (not recommended for this setup).
@@ -14,19 +21,16 @@ mcp = FastMCP(
 )
 
 # --- Register Features ---
-# Call the register function from each feature module
-print("Registering common features...")
-common.register(mcp)
-print("Registering entity features...")
-entities.register(mcp)
-print("Registering APM features...")
-apm.register(mcp)
-print("Registering Synthetics features...")
-synthetics.register(mcp)
-print("Registering Alerts features...")
-alerts.register(mcp)
+def register_all(server: FastMCP) -> None:
+    """Calls the register function from each feature module."""
+    for module in FEATURE_MODULES:
+        logger.debug("Registering %s features...", module.__name__.rsplit(".", 1)[-1])
+        module.register(server)
+    logger.debug("Feature registration complete.")
 
-print("Feature registration complete.")
+# Registration runs once, at import: `fastmcp run server.py:mcp` imports this
+# module and serves `mcp` directly.
+register_all(mcp)
 
 # --- Main execution block (for info and potential direct run debugging) ---
 if __name__ == "__main__":